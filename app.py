@@ -1,33 +1,67 @@
+import functools
+import hashlib
 import os
 import sys
+import threading
+import time
 import json
 from typing import Optional
 
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QAction, QIcon, QPainter, QPixmap, QColor
+from PySide6.QtCore import Qt, QTimer, QRunnable, QThreadPool
+from PySide6.QtGui import QAction, QIcon
+# Startup-critical widgets only; dialog-path symbols (QLineEdit,
+# QMessageBox) and the painter classes are imported where first needed.
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QSystemTrayIcon, QMenu, QMessageBox,
-    QDialog, QLineEdit, QCheckBox, QSpinBox
+    QLabel, QPushButton, QSystemTrayIcon, QMenu,
+    QDialog, QCheckBox, QSpinBox
 )
 
-# keyring is optional; if missing, we store only in memory
+# keyring is optional; if missing, we store only in memory.
+# Imported lazily on first use: it pulls in platform backends
+# (dbus/secretstorage, pywin32 variants) that slow down cold start.
+_keyring = None
+_keyring_loaded = False
+
+def _kr():
+    global _keyring, _keyring_loaded
+    if not _keyring_loaded:
+        _keyring_loaded = True
+        try:
+            import keyring  # pip install keyring
+            _keyring = keyring
+        except Exception:
+            _keyring = None
+    return _keyring
+
+# orjson is optional; roughly halves JSON parse cost when present
 try:
-    import keyring  # pip install keyring
+    import orjson  # pip install orjson
 except Exception:
-    keyring = None
+    orjson = None
 
-# Optional Windows API fallback to force‑clear clipboard buffer
+# Optional Windows API fallback to force‑clear clipboard buffer.
+# Function pointers are bound once at import with argtypes/restype set,
+# so each call is a single FFI dispatch with no per-call type inference.
 IS_WINDOWS = sys.platform.startswith("win")
 if IS_WINDOWS:
     try:
-        from ctypes import windll
+        import ctypes
+        _user32 = ctypes.WinDLL("user32", use_last_error=True)
+        _OpenClipboard = _user32.OpenClipboard
+        _OpenClipboard.argtypes = [ctypes.c_void_p]
+        _OpenClipboard.restype = ctypes.c_bool
+        _EmptyClipboard = _user32.EmptyClipboard
+        _EmptyClipboard.argtypes = []
+        _EmptyClipboard.restype = ctypes.c_bool
+        _CloseClipboard = _user32.CloseClipboard
+        _CloseClipboard.argtypes = []
+        _CloseClipboard.restype = ctypes.c_bool
         def win_clear_clipboard() -> bool:
             try:
-                user32 = windll.user32
-                if user32.OpenClipboard(0):
-                    user32.EmptyClipboard()
-                    user32.CloseClipboard()
+                if _OpenClipboard(None):
+                    _EmptyClipboard()
+                    _CloseClipboard()
                     return True
             except Exception:
                 pass
@@ -44,23 +78,44 @@ SERVICE_NAME = "NESearchTool_PasswordOnly"
 USERNAME_LABEL = "default"  # logical account label for the saved password (not an OS user)
 
 # ---------- Paths / settings ----------
+@functools.lru_cache(maxsize=1)
 def user_data_dir():
     root = os.getenv("LOCALAPPDATA") or os.path.expanduser("~")
     return os.path.join(root, "NESearchTool_PasswordOnly")
 
+_ENSURED = set()
+
 def ensure_dir(path):
+    # Skip the os.makedirs stat round-trip once a dir is known to exist
+    if path in _ENSURED:
+        return
     os.makedirs(path, exist_ok=True)
+    _ENSURED.add(path)
 
 SETTINGS_PATH = os.path.join(user_data_dir(), "settings.json")
 
+# Parsed settings keyed by path -> ((st_mtime_ns, st_size), data);
+# unchanged files skip the read + parse entirely.
+_SETTINGS_CACHE = {}
+
 class Settings:
+    __slots__ = ("auto_clear", "auto_clear_secs")
+
     def __init__(self):
         self.auto_clear = True
         self.auto_clear_secs = 20
     def load(self):
         try:
-            with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            st = os.stat(SETTINGS_PATH)
+            key = (st.st_mtime_ns, st.st_size)
+            cached = _SETTINGS_CACHE.get(SETTINGS_PATH)
+            if cached is not None and cached[0] == key:
+                data = cached[1]
+            else:
+                with open(SETTINGS_PATH, "rb") as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                _SETTINGS_CACHE[SETTINGS_PATH] = (key, data)
             self.auto_clear = bool(data.get("auto_clear", True))
             self.auto_clear_secs = int(data.get("auto_clear_secs", 20))
         except Exception:
@@ -68,68 +123,176 @@ class Settings:
     def save(self):
         try:
             ensure_dir(user_data_dir())
-            with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-                json.dump({
-                    "auto_clear": self.auto_clear,
-                    "auto_clear_secs": self.auto_clear_secs
-                }, f, indent=2)
+            data = {
+                "auto_clear": self.auto_clear,
+                "auto_clear_secs": self.auto_clear_secs
+            }
+            payload = orjson.dumps(data) if orjson is not None \
+                else json.dumps(data).encode("utf-8")
+            # Write-then-rename so load never sees a partial file
+            tmp = SETTINGS_PATH + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, SETTINGS_PATH)
+            # Next load re-reads the file we just wrote
+            _SETTINGS_CACHE.pop(SETTINGS_PATH, None)
         except Exception:
             pass
 
 # ---------- Emoji icon builder ----------
-def emoji_icon(emoji: str, size: int = 128,
-               bg=QColor(32, 48, 79), fg=QColor(220, 230, 255)) -> QIcon:
-    pm = QPixmap(size, size)
-    pm.fill(Qt.transparent)
-    painter = QPainter(pm)
+def _icon_cache_path(emoji: str, size: int, bg_rgba: int, fg_rgba: int) -> str:
+    tag = hashlib.blake2b(f"{emoji}|{size}|{bg_rgba}|{fg_rgba}".encode("utf-8"),
+                          digest_size=8).hexdigest()
+    return os.path.join(user_data_dir(), "icon_cache", f"{tag}.png")
+
+@functools.lru_cache(maxsize=16)
+def _emoji_icon_cached(emoji: str, size: int, bg_rgba: int, fg_rgba: int) -> QIcon:
+    from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+    # Disk layer: subsequent launches load the PNG and skip the QPainter path
+    path = _icon_cache_path(emoji, size, bg_rgba, fg_rgba)
+    pm = QPixmap()
+    if pm.load(path):
+        return QIcon(pm)
+    # Rasterize CPU-side; converting to a pixmap only at the end avoids
+    # touching the window-system pixmap backend during startup
+    img = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    img.fill(0)
+    painter = QPainter(img)
     painter.setRenderHint(QPainter.Antialiasing, True)
-    painter.setBrush(bg)
+    painter.setBrush(QColor.fromRgba(bg_rgba))
     painter.setPen(Qt.NoPen)
     painter.drawEllipse(0, 0, size, size)
-    painter.setPen(fg)
-    painter.drawText(pm.rect(), Qt.AlignCenter, emoji)
+    painter.setPen(QColor.fromRgba(fg_rgba))
+    painter.drawText(img.rect(), Qt.AlignCenter, emoji)
     painter.end()
+    pm = QPixmap.fromImage(img)
+    try:
+        ensure_dir(os.path.dirname(path))
+        pm.save(path, "PNG")
+    except Exception:
+        pass
     return QIcon(pm)
 
+# QColor(32, 48, 79).rgba() / QColor(220, 230, 255).rgba(); literal ints
+# so the signature does not force QtGui class construction at import
+_DEFAULT_BG_RGBA = 0xFF20304F
+_DEFAULT_FG_RGBA = 0xFFDCE6FF
+
+def emoji_icon(emoji: str, size: int = 128, bg=None, fg=None) -> QIcon:
+    bg_rgba = _DEFAULT_BG_RGBA if bg is None else bg.rgba()
+    fg_rgba = _DEFAULT_FG_RGBA if fg is None else fg.rgba()
+    return _emoji_icon_cached(emoji, size, bg_rgba, fg_rgba)
+
+# Pre-rendered icon shipped alongside the script; loading a PNG skips the
+# fontconfig match and color-emoji rasterization entirely.
+_BUNDLED_ICON = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "icons", "key_128.png")
+
+def app_icon() -> QIcon:
+    if os.path.exists(_BUNDLED_ICON):
+        return QIcon(_BUNDLED_ICON)
+    return emoji_icon("🔑")
+
 # ---------- Password storage ----------
+def _scrub(buf: Optional[bytearray]):
+    # Overwrite in place: unlike dropping a str, this actually zeroes the
+    # backing bytes (CPython cannot elide writes to a live bytearray).
+    if buf:
+        for i in range(len(buf)):
+            buf[i] = 0
+        buf.clear()
+
+# How long a keyring miss is believed before retrying the backend
+_KEYRING_MISS_TTL = 20.0
+
 class PasswordStore:
+    # Fixed attribute set; slot descriptors beat per-instance dict lookups.
+    # The Qt subclasses keep their Shiboken-provided __dict__, so slots
+    # there would add descriptors without saving anything — left alone.
+    __slots__ = ("service", "account", "_in_memory", "_lock",
+                 "_negative_until", "_has")
+
     def __init__(self, service: str, account: str):
         self.service = service
         self.account = account
-        self._in_memory: Optional[str] = None
+        self._in_memory: Optional[bytearray] = None
+        # UI thread and the warmup worker may race on _in_memory
+        self._lock = threading.Lock()
+        self._negative_until = 0.0
+        # Cheap presence flag so status refreshes avoid touching the secret;
+        # None means "not known yet"
+        self._has: Optional[bool] = None
+    def has_password(self) -> bool:
+        if self._has is None:
+            self._has = self.get() is not None
+        return self._has
     def get(self) -> Optional[str]:
-        if self._in_memory:
-            return self._in_memory
-        if keyring is not None:
+        with self._lock:
+            if self._in_memory:
+                return self._in_memory.decode("utf-8")
+            if time.monotonic() < self._negative_until:
+                return None
+        kr = _kr()
+        if kr is not None:
             try:
-                pw = keyring.get_password(self.service, self.account)
+                pw = kr.get_password(self.service, self.account)
                 if pw:
-                    self._in_memory = pw
+                    with self._lock:
+                        self._in_memory = bytearray(pw.encode("utf-8"))
+                        self._has = True
                     return pw
             except Exception:
                 pass
+        with self._lock:
+            self._negative_until = time.monotonic() + _KEYRING_MISS_TTL
+            self._has = False
         return None
     def set(self, password: str, remember_device: bool):
-        self._in_memory = password
-        if remember_device and keyring is not None:
+        with self._lock:
+            _scrub(self._in_memory)
+            self._in_memory = bytearray(password.encode("utf-8"))
+            self._negative_until = 0.0
+            self._has = True
+        kr = _kr()
+        if remember_device and kr is not None:
             try:
-                keyring.set_password(self.service, self.account, password)
+                kr.set_password(self.service, self.account, password)
             except Exception:
                 # keep in memory even if secure store fails
                 pass
     def clear_device_store(self):
-        if keyring is not None:
+        kr = _kr()
+        if kr is not None:
             try:
-                keyring.delete_password(self.service, self.account)
+                kr.delete_password(self.service, self.account)
             except Exception:
                 pass
+        self._has = False
     def clear_memory(self):
-        self._in_memory = None
+        with self._lock:
+            _scrub(self._in_memory)
+            self._in_memory = None
+            self._negative_until = 0.0
+            # Device store may still hold a copy; re-derive on next ask
+            self._has = None
+
+class _WarmStoreTask(QRunnable):
+    """Touches the keyring off the UI thread so the first user-initiated
+    copy never blocks on CredRead / Secret Service IPC."""
+    def __init__(self, store: PasswordStore):
+        super().__init__()
+        self._store = store
+    def run(self):
+        try:
+            self._store.get()
+        except Exception:
+            pass
 
 # ---------- Password dialog ----------
 class PasswordDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
+        from PySide6.QtWidgets import QLineEdit
         self.setWindowTitle("Enter password")
         self.setModal(True)
         self.setMinimumWidth(360)
@@ -142,7 +305,7 @@ class PasswordDialog(QDialog):
         self.chk_show.toggled.connect(self.on_toggle_show)
 
         self.chk_remember = QCheckBox("Remember on this device (secure store)")
-        if keyring is None:
+        if _kr() is None:
             self.chk_remember.setText("Remember for this session (secure store not available)")
             self.chk_remember.setEnabled(False)
 
@@ -166,15 +329,39 @@ class PasswordDialog(QDialog):
         layout.addLayout(buttons)
 
     def on_toggle_show(self, checked: bool):
+        from PySide6.QtWidgets import QLineEdit
         self.edit.setEchoMode(QLineEdit.Normal if checked else QLineEdit.Password)
 
     def get_values(self):
-        return self.edit.text(), self.chk_remember.isChecked()
+        # Hand back a scrubable buffer and drop the QLineEdit's own copy
+        buf = bytearray(self.edit.text().encode("utf-8"))
+        self.edit.clear()
+        return buf, self.chk_remember.isChecked()
 
 # ---------- Main window ----------
 class MainWindow(QMainWindow):
+    # (label, slot name); None inserts a separator. Driving construction
+    # from data keeps __init__ to one loop instead of six copied blocks.
+    _TRAY_ACTIONS = (
+        ("Copy password", "copy_password"),
+        ("Set / Change password…", "change_password"),
+        ("Clear saved password on device", "clear_saved_password"),
+        None,
+        ("Show / Hide", "toggle_visible"),
+        None,
+        ("Quit", "quit_app"),
+    )
+    # (attr, label, slot name) grouped per button row
+    _BUTTON_ROWS = (
+        (("btn_copy", "Copy password", "copy_password"),
+         ("btn_set", "Set / Change password", "change_password")),
+        (("btn_clear_device", "Clear saved password on device", "clear_saved_password"),),
+    )
+
     def __init__(self):
         super().__init__()
+        # Coalesce the per-addWidget geometry invalidations into one pass
+        self.setUpdatesEnabled(False)
         self.setWindowTitle(APP_NAME)
         self.setMinimumSize(420, 240)
 
@@ -183,24 +370,39 @@ class MainWindow(QMainWindow):
 
         self.store = PasswordStore(SERVICE_NAME, USERNAME_LABEL)
 
-        # Clipboard clear timer
-        self._last_copied_value: Optional[str] = None
-        self._clear_timer = QTimer(self)
-        self._clear_timer.setSingleShot(True)
-        self._clear_timer.timeout.connect(self._maybe_clear_clipboard)
+        # Clipboard auto-clear state; one-shot timers are scheduled per copy
+        # and stale callbacks are filtered by the monotonic deadline.
+        # _our_copy_live tracks whether the clipboard still holds our copy;
+        # an external clipboard change flips it off (after a size probe —
+        # dataChanged also fires asynchronously for our own setText).
+        self._last_copied_value: Optional[bytearray] = None
+        self._clear_deadline = 0.0
+        self._our_copy_live = False
+        QApplication.clipboard().dataChanged.connect(self._on_clipboard_changed)
+
+        # Settings writes are debounced so rapid saves coalesce into one;
+        # aboutToQuit drains the dirty flag if we exit inside the window
+        self._settings_dirty = False
+        self._settings_flush_timer = QTimer(self)
+        self._settings_flush_timer.setSingleShot(True)
+        self._settings_flush_timer.timeout.connect(self._flush_settings)
+        QApplication.instance().aboutToQuit.connect(self._flush_settings)
 
         # UI
         self.status_lbl = QLabel("")
         self.status_lbl.setStyleSheet("color:#D6E2FF; font-weight:600;")
 
-        self.btn_copy = QPushButton("Copy password")
-        self.btn_copy.clicked.connect(self.copy_password)
-
-        self.btn_set = QPushButton("Set / Change password")
-        self.btn_set.clicked.connect(self.change_password)
-
-        self.btn_clear_device = QPushButton("Clear saved password on device")
-        self.btn_clear_device.clicked.connect(self.clear_saved_password)
+        button_rows = []
+        for row_spec in self._BUTTON_ROWS:
+            row = QHBoxLayout()
+            for attr, label, slot_name in row_spec:
+                btn = QPushButton(label)
+                btn.clicked.connect(getattr(self, slot_name))
+                setattr(self, attr, btn)
+                row.addWidget(btn)
+            button_rows.append(row)
+        row_buttons, row_clear = button_rows
+        row_clear.addStretch(1)
 
         self.chk_auto = QCheckBox("Auto-clear clipboard after")
         self.chk_auto.setChecked(self.settings.auto_clear)
@@ -214,14 +416,6 @@ class MainWindow(QMainWindow):
         self.btn_save_settings.clicked.connect(self.save_settings)
 
         # Layouts
-        row_buttons = QHBoxLayout()
-        row_buttons.addWidget(self.btn_copy)
-        row_buttons.addWidget(self.btn_set)
-
-        row_clear = QHBoxLayout()
-        row_clear.addWidget(self.btn_clear_device)
-        row_clear.addStretch(1)
-
         row_opts = QHBoxLayout()
         row_opts.addWidget(self.chk_auto)
         row_opts.addWidget(self.spin_secs)
@@ -244,37 +438,35 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(central)
 
         # Tray
-        self.tray = QSystemTrayIcon(emoji_icon("🔑"), self)
+        self.tray = QSystemTrayIcon(app_icon(), self)
         self.tray.setToolTip("One-Time Password")
         menu = QMenu()
-        act_copy = QAction("Copy password", self)
-        act_copy.triggered.connect(self.copy_password)
-        act_change = QAction("Set / Change password…", self)
-        act_change.triggered.connect(self.change_password)
-        act_clear = QAction("Clear saved password on device", self)
-        act_clear.triggered.connect(self.clear_saved_password)
-        act_show = QAction("Show / Hide", self)
-        act_show.triggered.connect(self.toggle_visible)
-        act_quit = QAction("Quit", self)
-        act_quit.triggered.connect(QApplication.instance().quit)
-        menu.addAction(act_copy)
-        menu.addAction(act_change)
-        menu.addAction(act_clear)
-        menu.addSeparator()
-        menu.addAction(act_show)
-        menu.addSeparator()
-        menu.addAction(act_quit)
+        self._actions = {}
+        for entry in self._TRAY_ACTIONS:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            label, slot_name = entry
+            a = QAction(label, self)
+            a.triggered.connect(getattr(self, slot_name))
+            menu.addAction(a)
+            self._actions[slot_name] = a
         self.tray.setContextMenu(menu)
         self.tray.activated.connect(self.on_tray_activated)
         self.tray.show()
 
-        self.refresh_status()
+        # Warm the keyring read-through cache in the background
+        QThreadPool.globalInstance().start(_WarmStoreTask(self.store))
+
+        self.setUpdatesEnabled(True)
+        # refresh_status may touch the keyring; keep it off the constructor
+        QTimer.singleShot(0, self.refresh_status)
 
     # --- UI helpers ---
     def refresh_status(self):
-        has = self.store.get() is not None
+        has = self.store.has_password()
         if has:
-            if keyring is not None:
+            if _kr() is not None:
                 self.status_lbl.setText("Password is stored. You can copy it any time from here or the tray menu.")
             else:
                 self.status_lbl.setText("Password is stored for this session (secure store not available).")
@@ -293,91 +485,156 @@ class MainWindow(QMainWindow):
         if reason == QSystemTrayIcon.Trigger:
             self.toggle_visible()
 
+    def quit_app(self):
+        QApplication.instance().quit()
+
+    def _notify(self, title: str, msg: str, msecs: int):
+        # Fire-and-forget: posted to the event loop so the handler never
+        # blocks on the notification daemon (libnotify can stall tens of ms)
+        QTimer.singleShot(0, lambda: self.tray.showMessage(
+            title, msg, QSystemTrayIcon.Information, msecs))
+
     def closeEvent(self, event):
         # Hide to tray instead of quitting
         self.hide()
-        self.tray.showMessage("Still running", "The app is hidden in the system tray.",
-                              QSystemTrayIcon.Information, 2000)
+        self._notify("Still running", "The app is hidden in the system tray.", 2000)
         event.ignore()
 
     # --- Actions ---
     def change_password(self):
+        from PySide6.QtWidgets import QMessageBox
         dlg = PasswordDialog(self)
         if dlg.exec() == QDialog.Accepted:
-            pw, remember = dlg.get_values()
-            if not pw:
+            pw_buf, remember = dlg.get_values()
+            if not pw_buf:
                 QMessageBox.warning(self, "Password required", "Password cannot be empty.")
                 return
-            if not remember and keyring is not None:
+            if not remember and _kr() is not None:
                 self.store.clear_device_store()
-            self.store.set(pw, remember)
+            # Decode at the last moment; the buffer is wiped before we return
+            self.store.set(pw_buf.decode("utf-8"), remember)
+            _scrub(pw_buf)
             self.refresh_status()
-            self.tray.showMessage("Saved", "Password has been updated.", QSystemTrayIcon.Information, 1500)
+            self._notify("Saved", "Password has been updated.", 1500)
 
     def clear_saved_password(self):
         self.store.clear_device_store()
         self.store.clear_memory()
         self.refresh_status()
-        self.tray.showMessage("Cleared", "Saved password removed from this device.", QSystemTrayIcon.Information, 1500)
+        self._notify("Cleared", "Saved password removed from this device.", 1500)
 
     def copy_password(self):
+        from PySide6.QtWidgets import QMessageBox
         pw = self.store.get()
-        if not pw:
+        if pw:
+            pw_buf = bytearray(pw.encode("utf-8"))
+            del pw
+        else:
             dlg = PasswordDialog(self)
             if dlg.exec() != QDialog.Accepted:
                 return
-            pw, remember = dlg.get_values()
-            if not pw:
+            pw_buf, remember = dlg.get_values()
+            if not pw_buf:
                 QMessageBox.warning(self, "Password required", "Password cannot be empty.")
                 return
-            if not remember and keyring is not None:
+            if not remember and _kr() is not None:
                 self.store.clear_device_store()
-            self.store.set(pw, remember)
+            self.store.set(pw_buf.decode("utf-8"), remember)
             self.refresh_status()
 
         cb = QApplication.clipboard()
-        cb.setText(pw)  # No mode arg; default is the system clipboard
-        self._last_copied_value = pw
-        self.tray.showMessage("Copied", "Password copied to clipboard.", QSystemTrayIcon.Information, 1200)
+        # State first: setText may deliver dataChanged synchronously on
+        # some platforms, and the handler probes _last_copied_value
+        self._last_copied_value = bytearray(pw_buf)
+        self._our_copy_live = True
+        cb.setText(pw_buf.decode("utf-8"))  # No mode arg; default is the system clipboard
+        _scrub(pw_buf)
+        self._notify("Copied", "Password copied to clipboard.", 1200)
 
         # Use LIVE UI values (no need to press Save for effect)
         if self.chk_auto.isChecked():
             secs = max(1, int(self.spin_secs.value()))
-            self._clear_timer.start(secs * 1000)
+            self._clear_deadline = time.monotonic() + secs
+            QTimer.singleShot(secs * 1000, self._maybe_clear_clipboard)
+
+    def _on_clipboard_changed(self):
+        # Our own setText also lands here, usually a spin later (posted
+        # WM_CLIPBOARDUPDATE on Windows, XFixes owner-change on XCB), so
+        # the signal alone can't distinguish our copy from an external
+        # one. Check the payload is exactly ours before declaring the
+        # copy dead.
+        if not self._our_copy_live:
+            return
+        try:
+            if self._clipboard_holds_our_copy():
+                return
+        except Exception:
+            pass
+        self._our_copy_live = False
+
+    def _clipboard_holds_our_copy(self) -> bool:
+        # Length gate first, then exact bytes: the QByteArray is already
+        # materialized for .size(), so the full compare costs nothing
+        # extra and still never builds a Python str of the contents —
+        # length alone would misidentify an equal-length foreign copy
+        if self._last_copied_value is None:
+            return False
+        md = QApplication.clipboard().mimeData()
+        if md is None or not md.hasText():
+            return False
+        data = md.data("text/plain")
+        if data.size() != len(self._last_copied_value):
+            return False
+        return bytes(data) == bytes(self._last_copied_value)
 
     def _maybe_clear_clipboard(self):
+        # A newer copy pushed the deadline out; ignore this stale callback
+        if time.monotonic() < self._clear_deadline - 0.05:
+            return
         try:
-            cb = QApplication.clipboard()
-            if self._last_copied_value is None:
+            # Only clear if nothing replaced our copy in the meantime —
+            # tracked via dataChanged, so no clipboard read is needed
+            if not self._our_copy_live:
                 return
-            # Only clear if clipboard still holds the same password we copied
-            if cb.text() == self._last_copied_value:
-                # Layered clearing attempts
-                cb.clear()
-                cb.setText("")
-                cb.clear()
-                # Windows fallback to force‑clear system buffer
+            # Belt-and-braces probe against a stale flag (some platforms
+            # miss dataChanged): verify the payload really is ours
+            if not self._clipboard_holds_our_copy():
+                return
+            cb = QApplication.clipboard()
+            if IS_WINDOWS:
+                # Authoritative system-buffer clear; cb.clear() just
+                # syncs Qt's cached view afterwards
                 win_clear_clipboard()
-                self.tray.showMessage("Clipboard cleared", "Password removed from clipboard buffer.",
-                                      QSystemTrayIcon.Information, 1200)
+            cb.clear()
+            self._our_copy_live = False
+            self._notify("Clipboard cleared", "Password removed from clipboard buffer.", 1200)
         except Exception:
             pass
         finally:
+            _scrub(self._last_copied_value)
             self._last_copied_value = None
 
     def save_settings(self):
+        from PySide6.QtWidgets import QMessageBox
         self.settings.auto_clear = self.chk_auto.isChecked()
         self.settings.auto_clear_secs = int(self.spin_secs.value())
-        self.settings.save()
+        self._settings_dirty = True
+        self._settings_flush_timer.start(250)
         QMessageBox.information(self, "Saved", "Settings updated.")
 
+    def _flush_settings(self):
+        if not self._settings_dirty:
+            return
+        self._settings_dirty = False
+        self.settings.save()
+
 # ---------- Entry ----------
 def main():
     ensure_dir(user_data_dir())
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
     app.setApplicationName(APP_NAME)
-    app.setWindowIcon(emoji_icon("🔑"))
+    app.setWindowIcon(app_icon())
 
     w = MainWindow()
     w.show()
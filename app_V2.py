@@ -1,5 +1,9 @@
+import hashlib
+import hmac
 import os
+import struct
 import sys
+import threading
 import json
 import base64
 import ctypes
@@ -7,21 +11,35 @@ from ctypes import Structure, c_void_p, c_uint, c_wchar_p, POINTER, byref
 from typing import Optional
 
 from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QAction, QIcon, QPainter, QPixmap, QColor
+from PySide6.QtGui import QAction, QIcon
+# Only what module init and MainWindow construction need; the painter
+# classes and dialog-only symbols are imported where first used.
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QSystemTrayIcon, QMenu, QMessageBox,
-    QDialog, QLineEdit, QCheckBox, QSpinBox
+    QLabel, QPushButton, QSystemTrayIcon, QMenu,
+    QDialog, QCheckBox, QSpinBox
 )
 
 APP_NAME = "One-Time Password (Tray)"
 SERVICE_DIR = "NESearchTool_PasswordOnly"  # folder under LocalAppData
 CRED_FILENAME = "cred.json"                # DPAPI-protected storage
-SETTINGS_FILENAME = "settings.json"        # non-secret settings
+SETTINGS_FILENAME = "settings.bin"         # packed non-secret settings
+LEGACY_SETTINGS_FILENAME = "settings.json" # migrated once, then removed
 USERNAME_LABEL = "default"                 # logical credential label
 
 IS_WINDOWS = sys.platform.startswith("win")
 
+# orjson is optional (C implementation, much faster decode); falls back
+# to stdlib json when not installed. Only legacy-format reads still need
+# JSON — nothing writes it anymore.
+try:
+    import orjson  # pip install orjson
+except Exception:
+    orjson = None
+
+def _json_loads(raw: bytes):
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 # ---------------- Paths ----------------
 def user_data_dir() -> str:
     root = os.getenv("LOCALAPPDATA") or os.path.expanduser("~")
@@ -30,9 +48,20 @@ def user_data_dir() -> str:
 def ensure_dir(path: str):
     os.makedirs(path, exist_ok=True)
 
+def _atomic_write(path: str, payload: bytes):
+    # Write-then-rename so readers never observe a truncated file,
+    # even if we die mid-write
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
 DATA_DIR = user_data_dir()
 CRED_PATH = os.path.join(DATA_DIR, CRED_FILENAME)
 SETTINGS_PATH = os.path.join(DATA_DIR, SETTINGS_FILENAME)
+LEGACY_SETTINGS_PATH = os.path.join(DATA_DIR, LEGACY_SETTINGS_FILENAME)
 
 # ---------------- Windows DPAPI helpers ----------------
 # Secure, user-bound encryption without external deps (Windows only).
@@ -46,42 +75,126 @@ if IS_WINDOWS:
 
     CRYPTPROTECT_UI_FORBIDDEN = 0x01
 
-    def _bytes_to_blob(data: bytes):
+    # Declare prototypes once at import; ctypes otherwise re-infers the
+    # argument marshalling on every call
+    crypt32.CryptProtectData.argtypes = [
+        POINTER(DATA_BLOB), c_wchar_p, POINTER(DATA_BLOB),
+        c_void_p, c_void_p, c_uint, POINTER(DATA_BLOB)]
+    crypt32.CryptProtectData.restype = ctypes.c_int
+    crypt32.CryptUnprotectData.argtypes = [
+        POINTER(DATA_BLOB), c_void_p, POINTER(DATA_BLOB),
+        c_void_p, c_void_p, c_uint, POINTER(DATA_BLOB)]
+    crypt32.CryptUnprotectData.restype = ctypes.c_int
+    crypt32.CryptProtectMemory.argtypes = [c_void_p, c_uint, c_uint]
+    crypt32.CryptProtectMemory.restype = ctypes.c_int
+    crypt32.CryptUnprotectMemory.argtypes = [c_void_p, c_uint, c_uint]
+    crypt32.CryptUnprotectMemory.restype = ctypes.c_int
+    kernel32.LocalFree.argtypes = [c_void_p]
+    kernel32.LocalFree.restype = c_void_p
+
+    # One (in, out) DATA_BLOB pair per thread; ctypes Structure
+    # construction goes through metaclass machinery, so the pair is built
+    # once and only cbData/pbData are rewritten per call
+    _TLS = threading.local()
+
+    def _get_blobs():
+        blobs = getattr(_TLS, "blobs", None)
+        if blobs is None:
+            blobs = (DATA_BLOB(), DATA_BLOB())
+            _TLS.blobs = blobs
+        return blobs
+
+    def _fill_blob(blob: DATA_BLOB, data: bytes):
         buf = ctypes.create_string_buffer(data, len(data))
-        blob = DATA_BLOB(len(data), ctypes.addressof(buf))
+        blob.cbData = len(data)
+        blob.pbData = ctypes.addressof(buf)
         # Keep a reference to prevent GC
-        return blob, buf
+        return buf
 
     def _blob_to_bytes(blob: DATA_BLOB) -> bytes:
         if not blob.cbData or not blob.pbData:
             return b""
         return ctypes.string_at(blob.pbData, blob.cbData)
 
-    def dpapi_encrypt(plaintext: str) -> str:
+    def _wipe(buf):
+        # Zero a ctypes buffer so plaintext doesn't linger on the heap
+        ctypes.memset(buf, 0, ctypes.sizeof(buf))
+
+    def dpapi_encrypt_raw(plaintext: str) -> bytes:
         raw = plaintext.encode("utf-8")
-        in_blob, in_buf = _bytes_to_blob(raw)
-        out_blob = DATA_BLOB()
-        # BOOL CryptProtectData(DATA_BLOB*, LPCWSTR, DATA_BLOB*, PVOID, PVOID, DWORD, DATA_BLOB*);
-        ok = crypt32.CryptProtectData(byref(in_blob), c_wchar_p(None),
-                                      None, None, None,
-                                      CRYPTPROTECT_UI_FORBIDDEN,
-                                      byref(out_blob))
-        if not ok:
-            raise OSError("CryptProtectData failed")
+        in_blob, out_blob = _get_blobs()
+        in_buf = _fill_blob(in_blob, raw)
+        out_blob.cbData = 0
+        out_blob.pbData = None
         try:
-            enc = _blob_to_bytes(out_blob)
+            # BOOL CryptProtectData(DATA_BLOB*, LPCWSTR, DATA_BLOB*, PVOID, PVOID, DWORD, DATA_BLOB*);
+            ok = crypt32.CryptProtectData(byref(in_blob), c_wchar_p(None),
+                                          None, None, None,
+                                          CRYPTPROTECT_UI_FORBIDDEN,
+                                          byref(out_blob))
+            if not ok:
+                raise OSError("CryptProtectData failed")
+            try:
+                enc = _blob_to_bytes(out_blob)
+            finally:
+                if out_blob.pbData:
+                    kernel32.LocalFree(out_blob.pbData)
+                    out_blob.pbData = None
+                    out_blob.cbData = 0
         finally:
-            if out_blob.pbData:
-                kernel32.LocalFree(out_blob.pbData)
-        return base64.b64encode(enc).decode("ascii")
+            # in_buf holds the plaintext
+            _wipe(in_buf)
+        return enc
+
+    # In-process protection for the session copy of the secret. Unlike
+    # CryptProtectData there is no user-profile key derivation, so this is
+    # cheap enough for the hot path; the key dies with the process.
+    CRYPTPROTECTMEMORY_BLOCK_SIZE = 16
+    CRYPTPROTECTMEMORY_SAME_PROCESS = 0x00
+
+    def protect_inproc(password: str):
+        """Encrypt the secret in place; returns an opaque blob or None."""
+        raw = password.encode("utf-8")
+        padded = max(CRYPTPROTECTMEMORY_BLOCK_SIZE,
+                     -(-len(raw) // CRYPTPROTECTMEMORY_BLOCK_SIZE)
+                     * CRYPTPROTECTMEMORY_BLOCK_SIZE)
+        buf = ctypes.create_string_buffer(raw, padded)
+        raw = None
+        if not crypt32.CryptProtectMemory(buf, padded,
+                                          CRYPTPROTECTMEMORY_SAME_PROCESS):
+            ctypes.memset(buf, 0, padded)
+            return None
+        return (buf, len(password.encode("utf-8")))
+
+    def unprotect_inproc(blob) -> Optional[str]:
+        buf, n = blob
+        size = len(buf.raw)
+        tmp = ctypes.create_string_buffer(buf.raw, size)
+        try:
+            if not crypt32.CryptUnprotectMemory(tmp, size,
+                                                CRYPTPROTECTMEMORY_SAME_PROCESS):
+                return None
+            return tmp.raw[:n].decode("utf-8")
+        finally:
+            ctypes.memset(tmp, 0, size)
+
+    def wipe_inproc(blob):
+        buf, _n = blob
+        ctypes.memset(buf, 0, len(buf.raw))
 
     def dpapi_decrypt(b64: str) -> Optional[str]:
+        # Legacy path: cred files written before the raw-binary format
         try:
             enc = base64.b64decode(b64)
         except Exception:
             return None
-        in_blob, in_buf = _bytes_to_blob(enc)
-        out_blob = DATA_BLOB()
+        return dpapi_decrypt_raw(enc)
+
+    def dpapi_decrypt_raw(enc: bytes) -> Optional[str]:
+        in_blob, out_blob = _get_blobs()
+        in_buf = _fill_blob(in_blob, enc)
+        out_blob.cbData = 0
+        out_blob.pbData = None
         # BOOL CryptUnprotectData(DATA_BLOB*, LPWSTR*, DATA_BLOB*, PVOID, PVOID, DWORD, DATA_BLOB*);
         ok = crypt32.CryptUnprotectData(byref(in_blob), None,
                                         None, None, None, 0,
@@ -92,93 +205,181 @@ if IS_WINDOWS:
             dec = _blob_to_bytes(out_blob)
         finally:
             if out_blob.pbData:
+                # Zero the native plaintext before handing it back to the heap
+                ctypes.memset(out_blob.pbData, 0, out_blob.cbData)
                 kernel32.LocalFree(out_blob.pbData)
+                out_blob.pbData = None
+                out_blob.cbData = 0
         try:
             return dec.decode("utf-8")
         except Exception:
             return None
 else:
     # Non-Windows fallback (not secure; for completeness only)
-    def dpapi_encrypt(plaintext: str) -> str:
-        return base64.b64encode(plaintext.encode("utf-8")).decode("ascii")
     def dpapi_decrypt(b64: str) -> Optional[str]:
         try:
             return base64.b64decode(b64).decode("utf-8")
         except Exception:
             return None
+    def dpapi_encrypt_raw(plaintext: str) -> bytes:
+        return plaintext.encode("utf-8")
+    def dpapi_decrypt_raw(enc: bytes) -> Optional[str]:
+        try:
+            return enc.decode("utf-8")
+        except Exception:
+            return None
+    def protect_inproc(password: str):
+        return password
+    def unprotect_inproc(blob) -> Optional[str]:
+        return blob
+    def wipe_inproc(blob):
+        pass
 
-# Optional Windows API to aggressively clear clipboard buffer
-def win_clear_clipboard() -> bool:
-    if not IS_WINDOWS:
+# Optional Windows API to aggressively clear clipboard buffer; the
+# user32 entry points are bound and prototyped once at import rather
+# than re-resolved through ctypes.windll on every clear
+if IS_WINDOWS:
+    _user32 = ctypes.windll.user32
+    _OpenClipboard = _user32.OpenClipboard
+    _OpenClipboard.argtypes = [c_void_p]
+    _OpenClipboard.restype = ctypes.c_int
+    _EmptyClipboard = _user32.EmptyClipboard
+    _EmptyClipboard.argtypes = []
+    _EmptyClipboard.restype = ctypes.c_int
+    _CloseClipboard = _user32.CloseClipboard
+    _CloseClipboard.argtypes = []
+    _CloseClipboard.restype = ctypes.c_int
+
+    def win_clear_clipboard() -> bool:
+        try:
+            if _OpenClipboard(None):
+                _EmptyClipboard()
+                _CloseClipboard()
+                return True
+        except Exception:
+            pass
+        return False
+else:
+    def win_clear_clipboard() -> bool:
         return False
-    try:
-        user32 = ctypes.windll.user32
-        if user32.OpenClipboard(0):
-            user32.EmptyClipboard()
-            user32.CloseClipboard()
-            return True
-    except Exception:
-        pass
-    return False
 
 # ---------------- Settings (non-secret) ----------------
+# A few fixed fields don't warrant a JSON parser: a packed record loads
+# with a single read + unpack.
+_SETTINGS_PACK = struct.Struct("<BiB")  # auto_clear, auto_clear_secs, notify_on_clear
+_SETTINGS_PACK_V1 = struct.Struct("<Bi")  # before notify_on_clear existed
+
 class Settings:
     def __init__(self):
         self.auto_clear = True
         self.auto_clear_secs = 20
+        self.notify_on_clear = True
 
     def load(self):
         try:
-            with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(SETTINGS_PATH, "rb") as f:
+                raw = f.read()
+            if len(raw) >= _SETTINGS_PACK.size:
+                flag, secs, notify = _SETTINGS_PACK.unpack(raw[:_SETTINGS_PACK.size])
+                self.notify_on_clear = bool(notify)
+            else:
+                flag, secs = _SETTINGS_PACK_V1.unpack(raw[:_SETTINGS_PACK_V1.size])
+            self.auto_clear = bool(flag)
+            self.auto_clear_secs = int(secs)
+            return
+        except Exception:
+            pass
+        # One-time migration from the legacy JSON settings file
+        try:
+            with open(LEGACY_SETTINGS_PATH, "rb") as f:
+                data = _json_loads(f.read())
             self.auto_clear = bool(data.get("auto_clear", True))
             self.auto_clear_secs = int(data.get("auto_clear_secs", 20))
+            self.save()
+            os.remove(LEGACY_SETTINGS_PATH)
         except Exception:
             pass
 
     def save(self):
         try:
             ensure_dir(DATA_DIR)
-            with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-                json.dump({
-                    "auto_clear": self.auto_clear,
-                    "auto_clear_secs": self.auto_clear_secs
-                }, f, indent=2)
+            _atomic_write(SETTINGS_PATH,
+                          _SETTINGS_PACK.pack(int(self.auto_clear),
+                                              self.auto_clear_secs,
+                                              int(self.notify_on_clear)))
         except Exception:
             pass
 
 # ---------------- Credential storage (DPAPI on Windows) ----------------
+# path -> (st_mtime_ns, st_size, file bytes); shared across store
+# instances so a re-read after clear_memory() skips open() as long as
+# the file is unchanged
+_CRED_CACHE: dict = {}
+
+def _read_cred_file(path: str) -> bytes:
+    st = os.stat(path)
+    cached = _CRED_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    with open(path, "rb") as f:
+        blob = f.read()
+    _CRED_CACHE[path] = (st.st_mtime_ns, st.st_size, blob)
+    return blob
+
 class PasswordStore:
     def __init__(self, label: str):
         self.label = label
-        self._in_memory: Optional[str] = None
+        # CryptProtectMemory blob on Windows, plain str elsewhere
+        self._in_memory = None
+        # Set once a lookup hits FileNotFoundError; saves an os.stat per
+        # get() on machines that never saved a credential
+        self._known_absent = False
 
     def get(self) -> Optional[str]:
-        if self._in_memory:
-            return self._in_memory
-        # Try loading from DPAPI-protected file
+        if self._in_memory is not None:
+            pw = unprotect_inproc(self._in_memory)
+            if pw:
+                return pw
+        # Try loading from the DPAPI-protected file; raw ciphertext since
+        # the JSON/base64 wrapper was dropped (file bytes are memoized by
+        # mtime so repeated misses skip the read)
+        if self._known_absent:
+            return None
         try:
-            with open(CRED_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            enc = data.get("dpapi") or ""
-            if not enc:
+            blob = _read_cred_file(CRED_PATH)
+            if not blob:
                 return None
-            pw = dpapi_decrypt(enc)
+            if blob[:1] == b"{":
+                # Legacy JSON + base64 wrapper: decrypt once, rewrite raw
+                data = _json_loads(blob)
+                enc = data.get("dpapi") or ""
+                pw = dpapi_decrypt(enc) if enc else None
+                if pw:
+                    self._write_cred(pw)
+            else:
+                pw = dpapi_decrypt_raw(blob)
             if pw:
-                self._in_memory = pw
+                self._in_memory = protect_inproc(pw)
                 return pw
+        except FileNotFoundError:
+            self._known_absent = True
         except Exception:
             pass
         return None
 
+    def _write_cred(self, password: str):
+        ensure_dir(DATA_DIR)
+        _atomic_write(CRED_PATH, dpapi_encrypt_raw(password))
+        _CRED_CACHE.pop(CRED_PATH, None)
+        self._known_absent = False
+
     def set(self, password: str, remember_device: bool):
-        self._in_memory = password
+        if self._in_memory is not None:
+            wipe_inproc(self._in_memory)
+        self._in_memory = protect_inproc(password)
         if remember_device:
             try:
-                ensure_dir(DATA_DIR)
-                enc = dpapi_encrypt(password)
-                with open(CRED_PATH, "w", encoding="utf-8") as f:
-                    json.dump({"label": self.label, "dpapi": enc}, f)
+                self._write_cred(password)
             except Exception:
                 # If writing fails, we still keep it in memory for this session
                 pass
@@ -187,31 +388,58 @@ class PasswordStore:
         try:
             if os.path.exists(CRED_PATH):
                 os.remove(CRED_PATH)
+            _CRED_CACHE.pop(CRED_PATH, None)
+            self._known_absent = True
         except Exception:
             pass
 
     def clear_memory(self):
+        if self._in_memory is not None:
+            wipe_inproc(self._in_memory)
         self._in_memory = None
 
 # ---------------- Emoji icon builder ----------------
-def emoji_icon(emoji: str, size: int = 128,
-               bg=QColor(32, 48, 79), fg=QColor(220, 230, 255)) -> QIcon:
-    pm = QPixmap(size, size)
-    pm.fill(Qt.transparent)
-    painter = QPainter(pm)
+# QColor(32, 48, 79).rgba() / QColor(220, 230, 255).rgba() as plain ints,
+# so the defaults don't require QtGui at import time
+_DEFAULT_BG_RGBA = 0xFF20304F
+_DEFAULT_FG_RGBA = 0xFFDCE6FF
+
+# QIcon is ref-counted and immutable post-construction, so one instance is
+# safely shared between the window icon and the tray
+_ICON_CACHE: dict = {}
+
+def emoji_icon(emoji: str, size: int = 128, bg=None, fg=None) -> QIcon:
+    from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+    if bg is None:
+        bg = QColor.fromRgba(_DEFAULT_BG_RGBA)
+    if fg is None:
+        fg = QColor.fromRgba(_DEFAULT_FG_RGBA)
+    key = (emoji, size, bg.rgba(), fg.rgba())
+    icon = _ICON_CACHE.get(key)
+    if icon is not None:
+        return icon
+    # QImage is plain malloc'd memory on the raster path — cheaper to
+    # allocate and clear than a platform pixmap handle; conversion to a
+    # pixmap happens once at the end
+    img = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    img.fill(0)
+    painter = QPainter(img)
     painter.setRenderHint(QPainter.Antialiasing, True)
     painter.setBrush(bg)
     painter.setPen(Qt.NoPen)
     painter.drawEllipse(0, 0, size, size)
     painter.setPen(fg)
-    painter.drawText(pm.rect(), Qt.AlignCenter, emoji)
+    painter.drawText(img.rect(), Qt.AlignCenter, emoji)
     painter.end()
-    return QIcon(pm)
+    icon = QIcon(QPixmap.fromImage(img))
+    _ICON_CACHE[key] = icon
+    return icon
 
 # ---------------- Password dialog ----------------
 class PasswordDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
+        from PySide6.QtWidgets import QLineEdit
         self.setWindowTitle("Enter password")
         self.setModal(True)
         self.setMinimumWidth(360)
@@ -250,6 +478,7 @@ class PasswordDialog(QDialog):
         layout.addLayout(buttons)
 
     def on_toggle_show(self, checked: bool):
+        from PySide6.QtWidgets import QLineEdit
         self.edit.setEchoMode(QLineEdit.Normal if checked else QLineEdit.Password)
 
     def get_values(self):
@@ -266,16 +495,21 @@ class MainWindow(QMainWindow):
         self.settings.load()
 
         self.store = PasswordStore(USERNAME_LABEL)
+        self._last_status: Optional[bool] = None
 
-        # Clipboard clear timer and marker
-        self._last_copied_value: Optional[str] = None
+        # Clipboard clear timer and marker; only a digest (plus length for
+        # a cheap early reject) of the copied password is retained, never
+        # a second plaintext copy
+        self._last_copied_digest: Optional[bytes] = None
+        self._last_copied_len = 0
         self._clear_timer = QTimer(self)
         self._clear_timer.setSingleShot(True)
         self._clear_timer.timeout.connect(self._maybe_clear_clipboard)
 
         # UI
+        # Styled via the application-wide QLabel#status rule set in main()
         self.status_lbl = QLabel("")
-        self.status_lbl.setStyleSheet("color:#D6E2FF; font-weight:600;")
+        self.status_lbl.setObjectName("status")
 
         self.btn_copy = QPushButton("Copy password")
         self.btn_copy.clicked.connect(self.copy_password)
@@ -294,6 +528,11 @@ class MainWindow(QMainWindow):
         self.spin_secs.setValue(self.settings.auto_clear_secs)
         self.spin_secs.setSuffix(" s")
 
+        # Balloon popups cost a GDI/D-Bus round-trip per auto-clear; let
+        # users opt out
+        self.chk_notify = QCheckBox("Notify when clipboard is cleared")
+        self.chk_notify.setChecked(self.settings.notify_on_clear)
+
         self.btn_save_settings = QPushButton("Save settings")
         self.btn_save_settings.clicked.connect(self.save_settings)
 
@@ -312,6 +551,10 @@ class MainWindow(QMainWindow):
         row_opts.addStretch(1)
         row_opts.addWidget(self.btn_save_settings)
 
+        row_notify = QHBoxLayout()
+        row_notify.addWidget(self.chk_notify)
+        row_notify.addStretch(1)
+
         central = QWidget()
         lay = QVBoxLayout(central)
         lay.setContentsMargins(12, 12, 12, 12)
@@ -324,31 +567,15 @@ class MainWindow(QMainWindow):
         lay.addWidget(QLabel("Note: Windows Clipboard History (Win+V) is separate and not cleared by apps."))
         lay.addSpacing(8)
         lay.addLayout(row_opts)
+        lay.addLayout(row_notify)
         lay.addStretch(1)
         self.setCentralWidget(central)
 
-        # Tray
+        # Tray; the context menu is built lazily on first right-click since
+        # many sessions never open it
         self.tray = QSystemTrayIcon(emoji_icon("🔑"), self)
         self.tray.setToolTip("One-Time Password")
-        menu = QMenu()
-        act_copy = QAction("Copy password", self)
-        act_copy.triggered.connect(self.copy_password)
-        act_change = QAction("Set / Change password…", self)
-        act_change.triggered.connect(self.change_password)
-        act_clear = QAction("Clear saved password on device", self)
-        act_clear.triggered.connect(self.clear_saved_password)
-        act_show = QAction("Show / Hide", self)
-        act_show.triggered.connect(self.toggle_visible)
-        act_quit = QAction("Quit", self)
-        act_quit.triggered.connect(QApplication.instance().quit)
-        menu.addAction(act_copy)
-        menu.addAction(act_change)
-        menu.addAction(act_clear)
-        menu.addSeparator()
-        menu.addAction(act_show)
-        menu.addSeparator()
-        menu.addAction(act_quit)
-        self.tray.setContextMenu(menu)
+        self._tray_menu: Optional[QMenu] = None
         self.tray.activated.connect(self.on_tray_activated)
         self.tray.show()
 
@@ -357,6 +584,11 @@ class MainWindow(QMainWindow):
     # ---- Helpers ----
     def refresh_status(self):
         has = self.store.get() is not None
+        # setText invalidates layout and repaints even for identical text;
+        # skip it when the displayed state hasn't changed
+        if has == self._last_status:
+            return
+        self._last_status = has
         if has:
             self.status_lbl.setText("Password is stored. You can copy it any time from here or the tray menu.")
         else:
@@ -370,9 +602,38 @@ class MainWindow(QMainWindow):
             self.activateWindow()
             self.raise_()
 
+    def _ensure_tray_menu(self) -> QMenu:
+        if self._tray_menu is None:
+            menu = QMenu()
+            # Declarative action list; None marks a separator
+            for entry in (
+                ("Copy password", self.copy_password),
+                ("Set / Change password…", self.change_password),
+                ("Clear saved password on device", self.clear_saved_password),
+                None,
+                ("Show / Hide", self.toggle_visible),
+                None,
+                ("Quit", QApplication.instance().quit),
+            ):
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                text, slot = entry
+                a = QAction(text, self)
+                a.triggered.connect(slot)
+                menu.addAction(a)
+            self._tray_menu = menu
+            # Subsequent right-clicks are handled natively by Qt
+            self.tray.setContextMenu(menu)
+        return self._tray_menu
+
     def on_tray_activated(self, reason):
         if reason == QSystemTrayIcon.Trigger:
             self.toggle_visible()
+        elif reason == QSystemTrayIcon.Context and self._tray_menu is None:
+            # First right-click: build the menu and show it ourselves
+            from PySide6.QtGui import QCursor
+            self._ensure_tray_menu().popup(QCursor.pos())
 
     def closeEvent(self, event):
         # Hide to tray instead of quitting
@@ -383,6 +644,7 @@ class MainWindow(QMainWindow):
 
     # ---- Actions ----
     def change_password(self):
+        from PySide6.QtWidgets import QMessageBox
         dlg = PasswordDialog(self)
         if dlg.exec() == QDialog.Accepted:
             pw, remember = dlg.get_values()
@@ -404,6 +666,7 @@ class MainWindow(QMainWindow):
         self.tray.showMessage("Cleared", "Saved password removed from this device.", QSystemTrayIcon.Information, 1500)
 
     def copy_password(self):
+        from PySide6.QtWidgets import QMessageBox
         pw = self.store.get()
         if not pw:
             dlg = PasswordDialog(self)
@@ -422,7 +685,9 @@ class MainWindow(QMainWindow):
 
         cb = QApplication.clipboard()
         cb.setText(pw)  # System clipboard
-        self._last_copied_value = pw
+        self._last_copied_digest = hashlib.blake2b(
+            pw.encode("utf-8"), digest_size=16).digest()
+        self._last_copied_len = len(pw)
         self.tray.showMessage("Copied", "Password copied to clipboard.", QSystemTrayIcon.Information, 1200)
 
         # Live settings (no need to press Save for effect)
@@ -433,23 +698,36 @@ class MainWindow(QMainWindow):
     def _maybe_clear_clipboard(self):
         try:
             cb = QApplication.clipboard()
-            if self._last_copied_value is None:
+            if self._last_copied_digest is None:
                 return
-            if cb.text() == self._last_copied_value:
-                cb.clear()
-                cb.setText("")
+            txt = cb.text()
+            # Length early-reject: skip hashing a potentially huge payload
+            # the user copied in the interim
+            if len(txt) != self._last_copied_len:
+                return
+            digest = hashlib.blake2b(
+                txt.encode("utf-8", "ignore"), digest_size=16).digest()
+            del txt
+            # compare_digest avoids an early-exit compare on the digests
+            if hmac.compare_digest(digest, self._last_copied_digest):
+                if IS_WINDOWS:
+                    # One OpenClipboard/EmptyClipboard/CloseClipboard pass
+                    # clears the OS buffer; cb.clear() just syncs Qt's view
+                    win_clear_clipboard()
                 cb.clear()
-                win_clear_clipboard()  # Windows buffer clear
-                self.tray.showMessage("Clipboard cleared", "Password removed from clipboard buffer.",
-                                      QSystemTrayIcon.Information, 1200)
+                if self.settings.notify_on_clear:
+                    self.tray.showMessage("Clipboard cleared", "Password removed from clipboard buffer.",
+                                          QSystemTrayIcon.Information, 1200)
         except Exception:
             pass
         finally:
-            self._last_copied_value = None
+            self._last_copied_digest = None
 
     def save_settings(self):
+        from PySide6.QtWidgets import QMessageBox
         self.settings.auto_clear = self.chk_auto.isChecked()
         self.settings.auto_clear_secs = int(self.spin_secs.value())
+        self.settings.notify_on_clear = self.chk_notify.isChecked()
         self.settings.save()
         QMessageBox.information(self, "Saved", "Settings updated.")
 
@@ -459,6 +737,8 @@ def main():
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
     app.setApplicationName(APP_NAME)
+    # One CSS parse for the whole app instead of per-widget recompiles
+    app.setStyleSheet("QLabel#status { color:#D6E2FF; font-weight:600; }")
     app.setWindowIcon(emoji_icon("🔑"))
 
     w = MainWindow()